@@ -20,7 +20,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
 # OTHER DEALINGS IN THE SOFTWARE.
 
-# 23.04.2024, version 0.3.6
+# 30.08.2026, version 0.4.0
 # This module provides a variety of quality of life functions. Some notable examples are:
 #	- printing without starting a newline
 #	- printing arguments with a single command that can't be joined with "+" like strings
@@ -29,6 +29,9 @@
 #	- a threaded serial port
 #
 # Changelog
+#	- 30.08.2026:	Improved the performance of the distance calculations by vectorizing them with numpy,
+#					fixed a bug that caused getting a file name without cropping the extension to return an empty string,
+#					changed the serial port reads to return None instead of the string "not enough data" when the buffer doesn't hold enough bytes
 #	- 23.04.2024:	Added functionality to remove an item and all its associated data from a collection of lists,
 #					added functionality to recursively remove a tkinter widget and all its children (including from any list they and their data might live in)
 #	- 12.04.2024:	Fixed a bug that caused an error when trying to get a file name from an invalid path,
@@ -86,18 +89,38 @@
 #   - 10.01.2022:	Added functionality for serial ports including automatically re-establishing connection, if disconnected
 #   - 07.01.2022:	Initial version
 		
+import collections
+import math
 import serial
 import time
 import tkinter as tk
 import numpy as np
 import threading
 
-import matplotlib.figure as fig
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
 
-import glob
 import os
+import re
+from functools import lru_cache
 from serial.threaded import ReaderThread, Protocol
+
+# scipy is an optional dependency used to accelerate nearest point lookups on large plots
+try:
+	from scipy.spatial import cKDTree
+except ImportError:
+	cKDTree = None
+
+# numba is an optional dependency used to compile the closestPoint hot loop
+try:
+	from numba import njit
+except ImportError:
+	njit = None
+
+# optional compiled helper (built from _lflib.pyx) that accelerates the serial line reader
+try:
+	import _lflib
+except ImportError:
+	_lflib = None
 import serial.tools.list_ports
 
 # Returns the path of the binary executing the parent script
@@ -126,19 +149,26 @@ def pln(*args):
 def fstr(a, point=2):
 	# Check type of number
 	if isinstance(a, (int, np.integer)):
-		return "{0:d}".format(a)
-	elif np.isnan(a):
+		return f"{a:d}"
+	# Normalize numpy scalars so equal values share a cache entry
+	a = float(a)
+	# NaN never compares equal to itself and would churn the cache, so handle it up front
+	if math.isnan(a):
 		return "NaN"
-	elif np.isinf(a):
+	return _fstrCached(a, point)
+
+# Cached backend of fstr; formatting repeats a lot on redraws with unchanged labels
+@lru_cache(maxsize=4096)
+def _fstrCached(a, point):
+	if math.isinf(a):
 		return "Inf"
 	elif int(a) == a:
-		return fstr(int(a))
+		return f"{int(a):d}"
+	# Check if the numbers absolute value is too small to be displayed
+	elif abs(a) < 10 ** -point:
+		return f"{a:.{point}e}"
 	else:
-		# Check if the numbers absolute value is too small to be displayed
-		if abs(a) < pow(10, -point):
-			return "{0:.{1}e}".format(a, point)
-		else:
-			return "{0:.{1}f}".format(a, point)
+		return f"{a:.{point}f}"
 
 # Converts a string into a time in seconds
 # 
@@ -149,25 +179,15 @@ def timeToSeconds(t):
 	if not isinstance(t, str):
 		pln("Input ", t, " is not a string.")
 		return None
-	# Check if the input has the correct format and determine if hours are given
-	correctForm = True
-	hours = False
-	if not t[-3] == ":":
-		correctForm = False
-	if len(t) >= 6:
-		if t[-6] == ":":
-			hours = True
-		else:
-			correctForm = False
-	if not correctForm:
+	# Split into (hours,) minutes and seconds
+	parts = t.rsplit(":", 2)
+	if len(parts) < 2 or not all(part.isdigit() for part in parts):
 		pln("Input ", t, " does not have a proper format.")
 		return None
 	# Convert input to number of seconds
-	seconds = 0
-	seconds += int(t[-2:])
-	seconds += 60 * int(t[-5:-3])
-	if hours:
-		seconds += 3600 * int(t[:-6])
+	seconds = int(parts[-1]) + 60 * int(parts[-2])
+	if len(parts) == 3:
+		seconds += 3600 * int(parts[0])
 	return seconds
 
 # Brings a list into a given new order
@@ -183,20 +203,15 @@ def reorder(a, order):
 	if not len(a) == l:
 		pln("Input data and order both have to be of the same length, but they have length ", len(a), " and ", l, ".")
 		return
-	# Create new list
-	newList = [None]*l
+	# Reorder in place with a single slice assignment
 	try:
-		for i in range(l):
-			newList[i] = a[order[i]]
+		a[:] = [a[i] for i in order]
 	except TypeError:
 		pln("Order must be a list of integers.")
 		return
 	except IndexError:
 		pln("Order contains an out of bounds index.")
 		return
-	# Copy content back to original list
-	for i in range(l):
-		a[i] = newList[i]
 
 # Calculates the length of an array like structure
 # 
@@ -215,14 +230,14 @@ def lLen(a):
 # @param point2 Coordinates of the second point
 # @return distance between the points
 def distance(point1, point2):
+	point1 = np.asarray(point1, dtype=np.float64)
+	point2 = np.asarray(point2, dtype=np.float64)
 	n = max(len(point1), len(point2))
-	point1 = point1 + [0] * (n - len(point1))
-	point2 = point2 + [0] * (n - len(point2))
-	squareSum = 0
-	for i in range(0, n):
-		squareSum += pow((point2[i] - point1[i]), 2)
-	dist = np.sqrt(squareSum)
-	return dist
+	# Possibly pad inputs
+	point1 = np.pad(point1, (0, n - len(point1)))
+	point2 = np.pad(point2, (0, n - len(point2)))
+	diff = point2 - point1
+	return float(np.sqrt(diff @ diff))
 
 # Calculates the distance between two points using a summation norm with a customizable unit rhomboid
 # 
@@ -233,23 +248,38 @@ def distance(point1, point2):
 # @param unit Dimensions of the unit cuboid
 # @return distance between the points
 def distanceSum(point1, point2, unit=[1]):
+	point1 = np.asarray(point1, dtype=np.float64)
+	point2 = np.asarray(point2, dtype=np.float64)
+	unit = np.asarray(unit, dtype=np.float64)
 	# Treat all invalid numbers for the unit cuboid as 1
-	for i in range(0, len(unit)):
-		if unit[i] <= 0:
-			unit[i] = 1
+	unit = np.where(unit <= 0, 1, unit)
 	n = max(len(point1), len(point2))
 	# Possibly pad inputs
-	point1 = point1 + [0] * (n - len(point1))
-	point2 = point2 + [0] * (n - len(point2))
-	unit = unit + [1] * (n - len(unit))
+	point1 = np.pad(point1, (0, n - len(point1)))
+	point2 = np.pad(point2, (0, n - len(point2)))
+	unit = np.pad(unit, (0, max(0, n - len(unit))), constant_values=1)[:n]
 	# Calculate the distance
-	sumDist = 0
-	for i in range(0, n):
-		sumDist += abs(point2[i] - point1[i]) / unit[i]
-	return sumDist
+	return float(np.sum(np.abs(point2 - point1) / unit))
+
+if njit != None:
+	# Compiled kernel for closestPoint: walks a (D, N) data array and returns the index of the
+	# closest point within the unit rhomboid (-1 if there is none);
+	# no fastmath — its no-NaN assumption would make NaN points pass the distance comparison
+	@njit(cache=True)
+	def closestPointKernel(point, data, unit):
+		index = -1
+		curDist = 1.0
+		for i in range(data.shape[1]):
+			pointDist = 0.0
+			for d in range(data.shape[0]):
+				pointDist += abs(data[d, i] - point[d]) / unit[d]
+			if pointDist <= curDist:
+				index = i
+				curDist = pointDist
+		return index
 
 # Finds the closest point in an n-dimensional data set to given coordinates in range using a summation norm
-# 
+#
 # The area searched for the nearest point is a rhomboid
 # 
 # @param point
@@ -263,14 +293,75 @@ def closestPoint(point, data, dist=[-1]):
 		if len(data[i]) != N:
 			pln("Data set subarrays must have the same length!")
 			return None
-	index = None
-	curDist = 1
-	for i in range(0, N):
-		dataPoint = [r[i] for r in data]
-		pointDist = distanceSum(point, dataPoint, dist)
-		if pointDist <= curDist:
-			index = i
-			curDist = pointDist
+	if N == 0:
+		return None
+	# Stack the data into a contiguous (D, N) array to compare against all points in one pass
+	data = np.ascontiguousarray(np.asarray(data, dtype=np.float64))
+	D = data.shape[0]
+	point = np.asarray(point, dtype=np.float64)
+	point = np.pad(point, (0, max(0, D - len(point))))[:D]
+	# Treat all invalid numbers for the unit cuboid as 1
+	unit = np.asarray(dist, dtype=np.float64)
+	unit = np.where(unit <= 0, 1, unit)
+	unit = np.pad(unit, (0, max(0, D - len(unit))), constant_values=1)[:D]
+	# Walk the data in compiled code if numba is available
+	if njit != None:
+		index = closestPointKernel(point, data, unit)
+		if index < 0:
+			return None
+		return index
+	# Calculate all distances at once and pick the smallest one in range;
+	# NaN distances must not win the argmin, so mask them out first
+	pointDist = np.sum(np.abs(data.T - point) / unit, axis=1)
+	pointDist = np.where(np.isnan(pointDist), np.inf, pointDist)
+	index = int(np.argmin(pointDist))
+	if not (pointDist[index] <= 1):
+		return None
+	return index
+
+# Finds the closest data point of a plot to given coordinates in range using a summation norm
+#
+# Behaves like closestPoint on the x- and y-data of the plot, but for large plots a KD-tree
+# (scaled by the unit rhomboid) is cached on the line object and queried in O(log N) instead
+# of scanning all points. Requires scipy for the accelerated path and falls back to
+# closestPoint otherwise.
+#
+# @param point Coordinates to compare against
+# @param line Plot whose data is searched
+# @param dist Array with the maximum distance on the respective axis allowed for the resulting point; ignored if < 0
+# @return index of the point closest to the coordinates
+def closestPointLine(point, line, dist=[-1]):
+	xData = line.get_xdata()
+	yData = line.get_ydata()
+	# Building a tree only amortizes for large plots
+	if cKDTree == None or len(xData) < 1000:
+		return closestPoint(point, [xData, yData], dist)
+	# Treat all invalid numbers for the unit cuboid as 1
+	unit = np.asarray(dist, dtype=np.float64)
+	unit = np.where(unit <= 0, 1, unit)
+	unit = np.pad(unit, (0, max(0, 2 - len(unit))), constant_values=1)[:2]
+	# Reuse the cached tree if the data and unit rhomboid are unchanged; holding and comparing
+	# the array references themselves catches set_data swapping in new arrays of the same
+	# length without the id-recycling hazard of freed arrays (in-place element writes to the
+	# same arrays are not detected)
+	cached = getattr(line, "_LFLib_tree", None)
+	key = (len(xData), unit[0], unit[1])
+	if cached == None or cached[0] is not xData or cached[1] is not yData or cached[2] != key:
+		scaled = np.column_stack((np.asarray(xData, dtype=np.float64), np.asarray(yData, dtype=np.float64))) / unit
+		# cKDTree refuses non-finite data; cache a None tree so the scan isn't repeated per click
+		if np.isfinite(scaled).all():
+			tree = cKDTree(scaled)
+		else:
+			tree = None
+		cached = (xData, yData, key, tree)
+		line._LFLib_tree = cached
+	if cached[3] == None:
+		# Non-finite data can't be indexed in a KD-tree, use the linear scan instead
+		return closestPoint(point, [xData, yData], dist)
+	index = int(cached[3].query(np.asarray(point, dtype=np.float64) / unit)[1])
+	# The Euclidean tree query only approximates the summation norm, so verify the distance constraint
+	if distanceSum(point, [xData[index], yData[index]], dist) > 1:
+		return None
 	return index
 
 # Displays the x- and y-value of a point in a plot on a canvas on a mouse click
@@ -294,24 +385,55 @@ class dataTip:
 		self.x1 = 0
 		self.y1 = 0
 		self.enabled = tk.NORMAL
-		
-		# Create annotation
-		self.annotation = 0
-		self.drawAnnotation()
+		# Background bitmap of the axis used for blitting (captured on every full redraw)
+		self.background = None
+
+		# Create the annotation once; every click only moves and relabels it
+		self.annotation = ax.annotate("", xy=(0, 0), xytext=(10, 15),
+			textcoords='offset points',
+			bbox=dict(alpha=0.5, fc=self.faceColor),
+			arrowprops=dict(arrowstyle='->')
+		)
+		# Animated artists are excluded from full redraws and only drawn when blitting
+		self.annotation.set_animated(True)
 		self.annotation.set_visible(False)
 		self.annotated = False
-		
+
 		# Bind the click on the canvas
 		canvas.mpl_connect('button_press_event', self.handle_clickCanvas)
+		# Capture the background whenever the canvas is fully redrawn
+		canvas.mpl_connect('draw_event', self.handle_drawCanvas)
+		# The cached background is stale after a resize
+		canvas.mpl_connect('resize_event', self.handle_resizeCanvas)
+
+	# Event handler for a full redraw of the canvas
+	def handle_drawCanvas(self, event):
+		self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+		# The annotation is animated and skipped by the full draw, so blit it back on top
+		if self.annotated:
+			self.ax.draw_artist(self.annotation)
+			self.canvas.blit(self.ax.bbox)
+
+	# Event handler for a resize of the canvas
+	def handle_resizeCanvas(self, event):
+		self.background = None
+
+	# Redraws only the annotation over the cached background instead of the whole canvas
+	def blitAnnotation(self):
+		if self.background == None:
+			# No full draw has been captured yet, so a full canvas update is needed once
+			updateCanvas(self.canvas, self.ax, False, False)
+			return
+		self.canvas.restore_region(self.background)
+		if self.annotated:
+			self.ax.draw_artist(self.annotation)
+		self.canvas.blit(self.ax.bbox)
 
 	# (Re-) Draws the annotation
 	def drawAnnotation(self):
-		self.annotation = self.ax.annotate("x: " + fstr(self.x1, 2) + "\ny: " + fstr(self.y1, 2), 
-			xy=(self.x1, self.y1), xytext=(10, 15),
-			textcoords='offset points',
-			bbox=dict(alpha=0.5, fc=self.faceColor),
-			arrowprops=dict(arrowstyle='->')
-		)
+		self.annotation.xy = (self.x1, self.y1)
+		self.annotation.set_text("x: " + fstr(self.x1, 2) + "\ny: " + fstr(self.y1, 2))
+		self.annotation.set_visible(True)
 		self.annotated = True
 
 	# En- or disables the data tip
@@ -322,7 +444,7 @@ class dataTip:
 			self.enabled = state
 		elif state == tk.DISABLED:
 			self.enabled = state
-			self.annotation.remove()
+			self.annotation.set_visible(False)
 			self.annotated = False
 	
 	# Updates the line object
@@ -335,7 +457,7 @@ class dataTip:
 	def handle_clickCanvas(self, event):
 		if self.enabled == tk.NORMAL:
 			if self.annotated:
-				self.annotation.remove()
+				self.annotation.set_visible(False)
 				self.annotated = False
 			else:
 				xL = self.ax.get_xlim()
@@ -347,7 +469,7 @@ class dataTip:
 				if self.line != None:
 					xData = self.line.get_xdata()
 					yData = self.line.get_ydata()
-					index = closestPoint([event.xdata, event.ydata], [xData, yData], [self.dist*xSpan, self.dist*ySpan/sizeFac])
+					index = closestPointLine([event.xdata, event.ydata], self.line, [self.dist*xSpan, self.dist*ySpan/sizeFac])
 					if index != None:
 						self.x1, self.y1 = xData[index], yData[index]
 						self.drawAnnotation()
@@ -357,7 +479,7 @@ class dataTip:
 					for line in lines:
 						xData = line.get_xdata()
 						yData = line.get_ydata()
-						index = closestPoint([event.xdata, event.ydata], [xData, yData], [self.dist*xSpan, self.dist*ySpan/sizeFac])
+						index = closestPointLine([event.xdata, event.ydata], line, [self.dist*xSpan, self.dist*ySpan/sizeFac])
 						if index != None:
 							xy += [[xData[index], yData[index]]]
 					if len(xy) > 0:
@@ -371,7 +493,7 @@ class dataTip:
 						self.drawAnnotation()
 
 
-			updateCanvas(self.canvas, self.ax, False, True)
+			self.blitAnnotation()
 
 # Converts a string into a float (if possible) with respect to German point notation
 # 
@@ -394,23 +516,20 @@ def toFloat(a):
 # @param cropExt Whether to crop the file extention.
 # @return The name of the file.
 def fileNameFromPath(path, cropExt=True):
+	# Validate before the cache: unhashable input must warn, not raise from the cache wrapper
 	if not isinstance(path, str):
 		pln("Path ", path, " must be a string.")
 		return None
-	cropExtension = 0
-	cropDirectory = 0
+	return _fileNameFromPathCached(path, cropExt)
+
+# Cached backend of fileNameFromPath for validated string paths
+@lru_cache(maxsize=512)
+def _fileNameFromPathCached(path, cropExt):
+	# basename and splitext scan in C and handle the platform's path separators
+	base = os.path.basename(path)
 	if cropExt:
-		try:
-			# Calculate number of characters for extension
-			cropExtension = len(path) - path.rindex(".")
-		except ValueError:
-			pln("Path: \"", path, "\" doesn't have an extension.")
-	try:
-		# Calculate number of characters for directory
-		cropDirectory = path.rindex("/") + 1
-	except ValueError:
-		pln("Path: \"", path, "\" has no directory. If the file is in the same directory as the calling program, use: \"./[filename]\".")
-	return path[cropDirectory:-cropExtension]
+		return os.path.splitext(base)[0]
+	return base
 
 # Calculates the next consecutive number and path to store for a file.
 # 
@@ -418,21 +537,19 @@ def fileNameFromPath(path, cropExt=True):
 # @param dir Directory to place the file in, relative to the working directory.
 # @return Path to save the file in.
 def savePath(name, dir):
-	# get all previously saved files
-	files=glob.glob(dir + name + " *.*")
+	# pattern to extract the enumeration of previously saved files
+	pattern = re.compile(re.escape(name) + r" (\d+)\.[^.]+$")
 	# get highest number of a file
 	FilesMax = 0
-	if len(files) > 0:
-		# calculate number of characters before enumeration
-		numStart = len(dir + name + " ")
-		# calculate number of characters after enumeration
-		numCrop = len(files[0]) - files[0].rindex(".")
-		for f in files:
-			fNum = f[numStart:-numCrop]
-			if not fNum.isdigit():
-				continue
-			if int(fNum) > FilesMax:
-				FilesMax = int(fNum)
+	try:
+		# scan the directory once instead of globbing and re-slicing every file name
+		with os.scandir(dir if dir else ".") as entries:
+			for entry in entries:
+				match = pattern.match(entry.name)
+				if match and int(match.group(1)) > FilesMax:
+					FilesMax = int(match.group(1))
+	except OSError:
+		pass
 	# Return string to save file
 	return dir + name + " " + str(FilesMax + 1)
 
@@ -456,18 +573,11 @@ def getVisiblePlots(ax):
 # @param plot Plot to be saved.
 # @param path Path to save the file to (without file extension).
 def savePlotCSV(plot, path):
-	f = open(path + ".csv", mode = "w")
-	savedataX = plot.get_xdata()
-	savedataY = plot.get_ydata()
-	if type(savedataX) != list:
-		savedataX = savedataX.tolist()
-	if type(savedataY) != list:
-		savedataY = savedataY.tolist()
-	savedataX = str(savedataX)
-	savedataY = str(savedataY)
-	savedata = savedataX[1:len(savedataX)-1] + "\n" + savedataY[1:len(savedataY)-1]
-	f.write(savedata)
-	f.close
+	savedataX = np.asarray(plot.get_xdata())
+	savedataY = np.asarray(plot.get_ydata())
+	with open(path + ".csv", mode = "w") as f:
+		# savetxt streams straight from the numpy buffers instead of building one giant string
+		np.savetxt(f, np.vstack((savedataX, savedataY)), delimiter=",", fmt="%g")
 
 # Saves the data of a figure to a .csv file.
 # 
@@ -477,25 +587,19 @@ def savePlotCSV(plot, path):
 # @param fig Figure to be saved.
 # @param path Path to save the file to (without file extension).
 def saveFigCSV(fig, path):
-	f = open(path + ".csv", mode = "w")
-	# get all axes of the figure
-	allAx = fig.axes
-	for ax in allAx:
-		# get all visible lines on the axis
-		lines = getVisiblePlots(ax)
-		for plot in lines:
-			savedataX = plot.get_xdata()
-			savedataY = plot.get_ydata()
-			if type(savedataX) != list:
-				savedataX = savedataX.tolist()
-			if type(savedataY) != list:
-				savedataY = savedataY.tolist()
-			savedataX = str(savedataX)
-			savedataY = str(savedataY)
-			savedata = savedataX[1:len(savedataX)-1] + "\n" + savedataY[1:len(savedataY)-1] + "\n\n"
-			f.write(savedata)
-		f.write("\n")
-	f.close
+	# A large write buffer keeps the row writes from hitting the OS individually
+	with open(path + ".csv", mode = "w", buffering = 1 << 20) as f:
+		# get all axes of the figure
+		allAx = fig.axes
+		for ax in allAx:
+			# get all visible lines on the axis
+			lines = getVisiblePlots(ax)
+			for plot in lines:
+				# Write the coordinate rows one at a time to avoid a stacked intermediate copy
+				np.savetxt(f, np.asarray(plot.get_xdata())[None, :], delimiter=",", fmt="%g")
+				np.savetxt(f, np.asarray(plot.get_ydata())[None, :], delimiter=",", fmt="%g")
+				f.write("\n")
+			f.write("\n")
 
 # Window to bind events to
 window = None
@@ -513,19 +617,12 @@ def rescaleAx(ax, rescaleX=True, rescaleY=True):
 	if len(lines) == 0:
 		return
 	if rescaleX:
-		xData = lines[0].get_xdata()
-		minX = np.min(xData)
-		maxX = np.max(xData)
-		for line in lines:
-			xData = line.get_xdata()
-			curMin = np.min(xData)
-			curMax = np.max(xData)
-			if curMin < minX:
-				minX = curMin
-			if curMax > maxX:
-				maxX = curMax
+		# Concatenate the data of all lines to find the extrema in a single pass
+		allX = np.concatenate([np.asarray(line.get_xdata()) for line in lines])
+		minX = allX.min()
+		maxX = allX.max()
 		# Catch invalid data
-		if np.isinf(minX) or np.isnan(minX) or np.isinf(maxX) or np.isnan(maxX):
+		if not (np.isfinite(minX) and np.isfinite(maxX)):
 			return
 		if ax.get_xscale() == "linear":
 			spaceX = (maxX - minX) / 20
@@ -536,19 +633,12 @@ def rescaleAx(ax, rescaleX=True, rescaleY=True):
 			spaceX = np.log(maxX / minX) / 20
 			ax.set_xlim(minX / np.exp(spaceX), maxX * np.exp(spaceX))
 	if rescaleY:
-		yData = lines[0].get_ydata()
-		minY = np.min(yData)
-		maxY = np.max(yData)
-		for line in lines:
-			yData = line.get_ydata()
-			curMin = np.min(yData)
-			curMax = np.max(yData)
-			if curMin < minY:
-				minY = curMin
-			if curMax > maxY:
-				maxY = curMax
+		# Concatenate the data of all lines to find the extrema in a single pass
+		allY = np.concatenate([np.asarray(line.get_ydata()) for line in lines])
+		minY = allY.min()
+		maxY = allY.max()
 		# Catch invalid data
-		if np.isinf(minY) or np.isnan(minY) or np.isinf(maxY) or np.isnan(maxY):
+		if not (np.isfinite(minY) and np.isfinite(maxY)):
 			return
 		if ax.get_yscale() == "linear":
 			spaceY = (maxY - minY) / 20
@@ -563,8 +653,8 @@ def rescaleAx(ax, rescaleX=True, rescaleY=True):
 def updateCanvas(canvas, ax, rescaleX=True, rescaleY=True):
 	# Rescale the axis
 	rescaleAx(ax, rescaleX, rescaleY)
-	# Update canvas
-	canvas.draw()
+	# Update canvas (draw_idle lets matplotlib coalesce multiple redraw requests)
+	canvas.draw_idle()
 	# Flush events (if this was called by a tkinter event)
 	canvas.flush_events()
 
@@ -588,19 +678,14 @@ def removeFromLists(item, lists):
 		if not len(l) == listLen:
 			pln("Lists are not of the same length.")
 			return
-	# If there is only one list, no indexing is required
-	if len(lists) == 1:
-		while lists[0].count(item) > 0:
-			lists[0].remove(item)
-	else:
-		while lists[0].count(item) > 0:
-			# Get item index
-			index = lists[0].index(item)
-			# Remove item
-			lists[0].pop(index)
-			# Remove all associated data
-			for l in lists[1:]:
-				l.pop(index)
+	# Determine the indices to keep in a single pass
+	keep = [i for i, v in enumerate(lists[0]) if not (v is item or v == item)]
+	# Nothing to do if the item doesn't occur
+	if len(keep) == listLen:
+		return
+	# Rebuild all lists in place, dropping the item and its associated data
+	for l in lists:
+		l[:] = [l[i] for i in keep]
 
 # Builds a GUI using the tkinter grid manager.
 # 
@@ -721,6 +806,12 @@ def serPort(name="Auto", command=None, question=None, answer=None, final=None, s
 				raise SerialDisconnect
 		else:
 			port = serial.Serial(name)
+		# On Windows, enlarge the OS receive buffer so bursts accumulate into larger chunks
+		if os.name == "nt":
+			try:
+				port.set_buffer_size(rx_size=65536)
+			except (ValueError, IOError):
+				pass
 		return port
 	except (serial.serialutil.SerialException, SerialDisconnect):
 		pln("Could not open the serial port! Try un- and replugging the device or providing the correct port name.")
@@ -737,20 +828,26 @@ class sPort(Protocol):
 	# Nested class for internal buffer and port
 	class Buffer:
 		port = None
-		content = bytes(0)
+		content = bytearray()
+		# Number of bytes at the start of the content that have already been consumed
+		head = 0
 		size = 4096
 		disconnected = False
-		dummyFig = fig.Figure()
+		# Whether the closed port warning has already been printed for the current disconnect
+		warnedDisconnected = False
+		# Chunks received by the reader thread that haven't been drained into the content yet
+		pending = collections.deque()
+		drainScheduled = False
 		terminator = "\n"
+		# Function to be called when data has been read
+		handleData = None
+		# Outgoing bytes waiting to be flushed while write batching is enabled
+		writeBuffer = bytearray()
+		# Number of outgoing bytes to accumulate before writing to the port (0 disables batching)
+		writeLimit = 0
 
 	buffer = Buffer()
 
-	# Placeholder function to be called when data has been read
-	def dummy(self):
-		pass
-
-	handleData = dummy
-
 	# Constructor method
 	def __init__(self, name="Auto", terminatorV="\n"):
 		# Create serial port
@@ -761,11 +858,9 @@ class sPort(Protocol):
 	def start(self, maxSize=4096, handleFunc=None):
 		# Store function to be called when data is read
 		if handleFunc != None:
-			sPort.handleData = handleFunc
+			self.buffer.handleData = handleFunc
 		# Set the maximum buffer size
 		self.buffer.size = maxSize
-		# Add a canvas to the dummy figure
-		FigureCanvasTkAgg(self.buffer.dummyFig)
 		# Initialize reading thread
 		self.reader = ReaderThread(self.buffer.port, sPort)
 		# Start reading thread
@@ -774,26 +869,49 @@ class sPort(Protocol):
 	# Callback function to store read data to the internal buffer and possibly do externally configured tasks
 	def readStoreBuffer(self, data):
 		# Write data to internal buffer if it fits (discard it otherwise)
-		if len(self.buffer.content) + len(data) <= self.buffer.size:
-			self.buffer.content += data
-		self.handleData()
+		if len(self.buffer.content) - self.buffer.head + len(data) <= self.buffer.size:
+			self.buffer.content.extend(data)
+		# The handler used to be invoked as a bound method, so keep passing the port instance
+		if self.buffer.handleData != None:
+			self.buffer.handleData(self)
+
+	# Drains all pending chunks into the internal buffer and notifies the data handler once
+	def drainBuffer(self):
+		self.buffer.drainScheduled = False
+		pending = self.buffer.pending
+		while pending:
+			data = pending.popleft()
+			# Write data to internal buffer if it fits (discard it otherwise)
+			if len(self.buffer.content) - self.buffer.head + len(data) <= self.buffer.size:
+				self.buffer.content.extend(data)
+		# The handler used to be invoked as a bound method, so keep passing the port instance
+		if self.buffer.handleData != None:
+			self.buffer.handleData(self)
+
+	# Discards the consumed prefix of the buffer once it outgrows the unread remainder
+	def compactBuffer(self):
+		if self.buffer.head > 4096 and self.buffer.head > len(self.buffer.content) // 2:
+			del self.buffer.content[:self.buffer.head]
+			self.buffer.head = 0
 
 	# Clear the internal buffer
-	def clearBuffer(self, clearLine=False):
-		# Flush events
-		self.buffer.dummyFig.canvas.flush_events()
-		# Update the GUI
-		window.update_idletasks()
+	#
+	# @param clearLine Whether to only empty the buffer up to the last newline character.
+	# @param sync Whether to process pending GUI events first so data still in flight reaches the buffer before it is cleared.
+	def clearBuffer(self, clearLine=False, sync=False):
+		if sync:
+			# Update the GUI
+			window.update_idletasks()
 		if clearLine:
 			# Empty the buffer up to the last newline character
-			numBytes = len(self.buffer.content)
-			for newLineIndex in range(numBytes-1, -1, -1):
-				if chr(self.buffer.content[newLineIndex]) == "\n":
-					self.buffer.content = self.buffer.content[newLineIndex+1:len(self.buffer.content)]
-					break
+			newLineIndex = self.buffer.content.rfind(b"\n")
+			if newLineIndex >= self.buffer.head:
+				self.buffer.head = newLineIndex + 1
+				self.compactBuffer()
 		else:
 			# empty the buffer
-			self.buffer.content = bytes(0)
+			self.buffer.content.clear()
+			self.buffer.head = 0
 
 	def connection_made(self, transport):
 		"""Called when reader thread is started"""
@@ -802,7 +920,11 @@ class sPort(Protocol):
 
 	def data_received(self, data):
 		"""Called with snippets received from the serial port"""
-		window.after(0, self.readStoreBuffer, data)
+		# Collect chunks and schedule a single drain so bursts don't flood the Tk event queue
+		self.buffer.pending.append(data)
+		if not self.buffer.drainScheduled:
+			self.buffer.drainScheduled = True
+			window.after_idle(self.drainBuffer)
 
 	def reopen(self):
 		newPort = None
@@ -816,6 +938,7 @@ class sPort(Protocol):
 		if newPort != None:
 			self.buffer.port = newPort
 			self.buffer.disconnected = False
+			self.buffer.warnedDisconnected = False
 			newReader = ReaderThread(self.buffer.port, sPort)
 			newReader.start()
 		else:
@@ -830,47 +953,169 @@ class sPort(Protocol):
 	def disconnected(self):
 		return self.buffer.disconnected
 
-	# Reads a specified number of bytes (1 if no parameter is given) from the wrapped serial port (if there is data available), 
-	# removes it from the buffer and returns it
+	# Reads a specified number of bytes (1 if no parameter is given) from the wrapped serial port (if there is data available),
+	# removes it from the buffer and returns it (None if not enough data is buffered)
 	def readB(self, bytes=1):
-		numBytes = len(self.buffer.content)
-		if numBytes < bytes:
-			return "not enough data"
-		retVal = self.buffer.content[0:bytes]
-		self.buffer.content = self.buffer.content[bytes:len(self.buffer.content)]
+		buffer = self.buffer
+		head = buffer.head
+		if len(buffer.content) - head < bytes:
+			return None
+		# the parameter shadows the builtin bytes, so copy the slice out via a memoryview
+		retVal = memoryview(buffer.content)[head:head+bytes].tobytes()
+		buffer.head = head + bytes
+		self.compactBuffer()
 		return retVal
 
-	# Reads a line from the wrapped serial port (if there is one available), 
+	# Reads a line from the wrapped serial port (if there is one available),
+	# removes it from the buffer and returns the raw bytes (without the newline character at the end).
+	#
+	# Callers that forward, frame or hash the data can skip the UTF-8 decode entirely.
+	#
+	# @return bytes of the line (None if no complete line is buffered)
+	def readL_raw(self):
+		# bind the attribute chains once, they are looked up per line otherwise
+		buffer = self.buffer
+		content = buffer.content
+		# The compiled helper fuses the scan, slice and cursor advance into one C call
+		if _lflib != None:
+			retVal, buffer.head = _lflib.read_line(content, buffer.head)
+			if retVal == None:
+				return None
+			self.compactBuffer()
+			return retVal
+		# Find the next newline in a single C-level scan
+		newLineIndex = content.find(b"\n", buffer.head)
+		if newLineIndex < 0:
+			return None
+		retVal = memoryview(content)[buffer.head:newLineIndex].tobytes()
+		# Only advance the cursor; compaction shifts the remaining bytes at most occasionally
+		buffer.head = newLineIndex + 1
+		self.compactBuffer()
+		return retVal
+
+	# Reads a line from the wrapped serial port (if there is one available),
 	# removes it from the buffer and returns it as a string (without the newline character at the end).
+	#
+	# @return the line as a string (None if no complete line is buffered)
 	def readL(self, forceWait=True):
-		numBytes = len(self.buffer.content)
-		newLineIndex = 0
-		for newLineIndex in range(numBytes):
-			if chr(self.buffer.content[newLineIndex]) == "\n":
-				try:
-					retVal = self.buffer.content[0:newLineIndex].decode()
-				except UnicodeDecodeError:
-					retVal = "Read data isn't a string"
-				self.buffer.content = self.buffer.content[newLineIndex+1:len(self.buffer.content)]
-				return retVal
-		return "not enough data"
-	
-	# Writes data to the wrapped serial port.
-	def write(self, data):
-		if self.buffer.disconnected:
+		retVal = self.readL_raw()
+		if retVal == None:
+			return None
+		# Let the decoder replace malformed bytes inline instead of raising and unwinding
+		return retVal.decode("utf-8", "replace")
+
+	# Reads all complete lines currently in the buffer, removes them from it and
+	# yields them one by one as strings (without the newline characters at the end).
+	#
+	# Consuming every buffered line in one call amortizes the per-call overhead
+	# that polling readL in a loop pays per line.
+	def readLines(self):
+		while True:
+			line = self.readL_raw()
+			if line == None:
+				break
+			yield line.decode("utf-8", "replace")
+
+	# Reads a length-prefixed frame from the wrapped serial port (if a complete one is available)
+	# and removes it from the buffer.
+	#
+	# Frames carry binary payloads without escaping and are consumed without scanning for a
+	# terminator; the counterpart is writeFrame. Newline based framing (readL/writeL) is unaffected.
+	#
+	# @return payload of the frame as bytes (None if no complete frame is buffered)
+	def readFrame(self):
+		buffer = self.buffer
+		content = buffer.content
+		head = buffer.head
+		available = len(content) - head
+		if available < 2:
+			return None
+		# The payload length is a 2 byte big endian prefix
+		length = int.from_bytes(content[head:head+2], "big")
+		if available < 2 + length:
+			return None
+		payload = memoryview(content)[head+2:head+2+length].tobytes()
+		buffer.head = head + 2 + length
+		self.compactBuffer()
+		return payload
+
+	# Writes a length-prefixed frame to the wrapped serial port.
+	#
+	# @param data Payload of the frame (at most 65535 bytes).
+	def writeFrame(self, data):
+		if len(data) > 0xFFFF:
+			pln("Frame payload may be at most 65535 bytes long.")
+			return
+		# Prefix and payload go out as one write so they share a single port submission
+		self.write(len(data).to_bytes(2, "big") + data)
+
+	# Warns about a write to a closed port, but only once per disconnect
+	# (a caller looping on a disconnected port would otherwise flush stdout on every attempt).
+	def warnDisconnected(self):
+		if not self.buffer.warnedDisconnected:
 			pln("Where are you tryinng to write to? The port is closed!")
+			self.buffer.warnedDisconnected = True
+
+	# Enables or disables coalescing of writes into batches.
+	#
+	# While enabled, write and writeL collect outgoing bytes and only hand them to the port
+	# once the given number of bytes has accumulated or flush is called explicitly.
+	#
+	# @param limit Number of bytes to accumulate before writing to the port (0 disables batching and flushes immediately).
+	def bufferWrites(self, limit=4096):
+		self.buffer.writeLimit = limit
+		if limit <= 0:
+			self.flush()
+
+	# Writes all batched data to the wrapped serial port.
+	def flush(self):
+		if len(self.buffer.writeBuffer) == 0:
+			return
+		data = memoryview(self.buffer.writeBuffer).tobytes()
+		self.buffer.writeBuffer.clear()
+		if self.buffer.disconnected:
+			self.warnDisconnected()
 			return
 		try:
 			self.buffer.port.write(data)
 		except OSError:
 			pln("Error in writing (the port is probably closed but hasn't noticed yet)")
-	
+
+	# Writes data to the wrapped serial port.
+	def write(self, data):
+		buffer = self.buffer
+		if buffer.writeLimit > 0:
+			# Batch the data and only flush once enough has accumulated
+			writeBuffer = buffer.writeBuffer
+			writeBuffer.extend(data)
+			if len(writeBuffer) >= buffer.writeLimit:
+				self.flush()
+			return
+		if buffer.disconnected:
+			self.warnDisconnected()
+			return
+		try:
+			buffer.port.write(data)
+		except OSError:
+			pln("Error in writing (the port is probably closed but hasn't noticed yet)")
+
 	# Writes a line to the wrapped serial port.
 	def writeL(self, s):
-		if self.buffer.disconnected:
-			pln("Where are you tryinng to write to? The port is closed!")
+		buffer = self.buffer
+		if buffer.writeLimit > 0:
+			# Batch the line and only flush once enough has accumulated;
+			# appending the terminator separately avoids concatenating strings first
+			writeBuffer = buffer.writeBuffer
+			writeBuffer.extend(s.encode())
+			writeBuffer.append(0x0A)
+			if len(writeBuffer) >= buffer.writeLimit:
+				self.flush()
+			return
+		if buffer.disconnected:
+			self.warnDisconnected()
 			return
 		try:
-			self.buffer.port.write((s + '\n').encode())
+			# Append the terminator to the encoded bytes so the string isn't copied before encoding
+			buffer.port.write(s.encode() + b"\n")
 		except OSError:
 			pln("Error in writing (the port is probably closed but hasn't noticed yet)")
@@ -0,0 +1,37 @@
+# Copyright (c) 2026 Lukas Freudenberg
+#
+# Optional C accelerator for LFLib.
+#
+# This module is not required: LFLib falls back to its pure Python
+# implementation when the compiled extension isn't available.
+# Build it in place with:
+#	cythonize -i _lflib.pyx
+
+from libc.string cimport memchr
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+
+def read_line(object buf, Py_ssize_t head):
+	"""Finds the first newline in buf at or after head.
+
+	Returns a tuple (line, newHead) where line holds the bytes between head
+	and the newline (None if there is no newline) and newHead is the cursor
+	position after the consumed line.
+	"""
+	cdef Py_buffer view
+	cdef const char *start
+	cdef const char *newline
+	cdef object line
+	PyObject_GetBuffer(buf, &view, PyBUF_SIMPLE)
+	try:
+		if head < 0 or head >= view.len:
+			return None, head
+		start = <const char *>view.buf + head
+		newline = <const char *>memchr(start, 10, view.len - head)
+		if newline == NULL:
+			return None, head
+		line = PyBytes_FromStringAndSize(start, newline - start)
+		return line, head + (newline - start) + 1
+	finally:
+		PyBuffer_Release(&view)